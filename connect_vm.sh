@@ -19,7 +19,7 @@ while true; do
     echo "或者，我可以尝试为您自动扫描并连接..."
     
     # 简单的 ARP 扫描尝试找到虚拟机 (MAC地址我们在 swift 代码里固定了: 02:00:00:00:00:01)
-    VM_IP=$(arp -a | grep "2:0:0:0:0:1" | awk -F'[()]' '{print $2}')
+    VM_IP=$(arp -a | awk -F'[()]' '/2:0:0:0:0:1/ {print $2}')
     
     if [ -n "$VM_IP" ]; then
         echo "发现虚拟机 IP: $VM_IP"
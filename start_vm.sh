@@ -54,7 +54,12 @@ echo "SSH Key: ./vm_key"
 echo "----------------------------------------------------------------"
 
 # Run the swift binary
-# Ensure it is signed with entitlements (idempotent, fast)
-codesign --sign - --entitlements vmstart.entitlements --force ./vmstart > /dev/null 2>&1
+# Ensure it is signed with entitlements. Re-sign only when the binary or the
+# entitlements changed since the last successful signing (tracked by the stamp
+# file's mtime), so a normal start skips the codesign exec entirely.
+CODESIGN_STAMP=".vmstart.codesign.stamp"
+if [ ! -f "$CODESIGN_STAMP" ] || [ ./vmstart -nt "$CODESIGN_STAMP" ] || [ vmstart.entitlements -nt "$CODESIGN_STAMP" ]; then
+    codesign --sign - --entitlements vmstart.entitlements --force ./vmstart > /dev/null 2>&1 && touch "$CODESIGN_STAMP"
+fi
 
 ./vmstart
@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# 获取所有运行中的 vmstart 进程
-VMS=$(ps aux | grep "[v]mstart" | grep -v "grep")
+# 获取所有运行中的 vmstart 进程 (只调用一次 ps，后面复用这份快照)
+VMS=$(ps -eo pid,lstart,command | grep "[v]mstart")
 
 if [ -z "$VMS" ]; then
     echo "没有正在运行的虚拟机。"
@@ -12,15 +12,12 @@ echo -e "PID\tSTART_TIME\tCOMMAND"
 echo "----------------------------------------------------------------"
 
 # 格式化输出
-ps -eo pid,lstart,command | grep "[v]mstart" | while read -r line; do
-    pid=$(echo $line | awk '{print $1}')
-    # 提取启动时间 (第2到第6列)
-    start_time=$(echo $line | awk '{print $2,$3,$4,$5,$6}')
-    # 提取命令路径
-    cmd=$(echo $line | awk '{print $7}')
+# 直接由 read 拆分字段: PID、启动时间 (5 列)、命令路径，其余丢弃
+while read -r pid w mon day time year cmd _; do
+    start_time="$w $mon $day $time $year"
     
     echo -e "$pid\t$start_time\t$cmd"
-done
+done <<< "$VMS"
 
 echo "----------------------------------------------------------------"
 echo "提示: 如需停止虚拟机，可以使用 'kill <PID>' 命令。"
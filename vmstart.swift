@@ -38,13 +38,14 @@ func createVirtualMachine() -> VZVirtualMachine? {
     // Platform (Generic)
     let platform = VZGenericPlatformConfiguration()
     let machineIdentifier: VZGenericMachineIdentifier
-    if FileManager.default.fileExists(atPath: machineIdPath),
-       let data = try? Data(contentsOf: URL(fileURLWithPath: machineIdPath)),
+    // A missing file just makes Data(contentsOf:) fail, no need to stat it first
+    if let data = try? Data(contentsOf: URL(fileURLWithPath: machineIdPath)),
        let id = VZGenericMachineIdentifier(dataRepresentation: data) {
         machineIdentifier = id
     } else {
         machineIdentifier = VZGenericMachineIdentifier()
-        try? machineIdentifier.dataRepresentation.write(to: URL(fileURLWithPath: machineIdPath))
+        // Atomic write: a crash mid-write must not leave a truncated identifier behind
+        try? machineIdentifier.dataRepresentation.write(to: URL(fileURLWithPath: machineIdPath), options: .atomic)
     }
     platform.machineIdentifier = machineIdentifier
     config.platform = platform
@@ -58,9 +59,8 @@ func createVirtualMachine() -> VZVirtualMachine? {
         return nil
     }
 
-    // Storage: Seed ISO
-    if FileManager.default.fileExists(atPath: seedPath),
-       let seedAttachment = try? VZDiskImageStorageDeviceAttachment(url: URL(fileURLWithPath: seedPath), readOnly: true) {
+    // Storage: Seed ISO (optional; the attachment fails to open if it is absent)
+    if let seedAttachment = try? VZDiskImageStorageDeviceAttachment(url: URL(fileURLWithPath: seedPath), readOnly: true) {
         let seedParams = VZVirtioBlockDeviceConfiguration(attachment: seedAttachment)
         config.storageDevices.append(seedParams)
     }